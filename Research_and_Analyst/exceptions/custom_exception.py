@@ -1,6 +1,8 @@
 import sys
+import inspect
 import traceback
-from typing import Optional, cast
+from functools import cached_property
+from typing import Optional
 
 class ResearchAnalystException(Exception):
     def __init__(self, error_message, error_details: Optional[object] = None):
@@ -14,50 +16,74 @@ class ResearchAnalystException(Exception):
         exc_type = exc_value = exc_tb = None
         if error_details is None:
             exc_type, exc_value, exc_tb = sys.exc_info()
+        elif error_details is sys: # legacy `raise ResearchAnalystException(..., sys)` call sites
+            exc_type, exc_value, exc_tb = sys.exc_info()
+        # If a real exception object is passed, extract:
+        #  -   Its type (type(error_details))
+        #  -   The exception instance
+        #  -   Its traceback (__traceback__)
+        elif isinstance(error_details, Exception): # e.g., a raised exception
+            exc_type, exc_value, exc_tb = type(error_details), error_details, error_details.__traceback__
         else:
-            if hasattr(error_details, "exc_info"): # e.g., sys
-                exc_info_obj = cast(sys, error_details)
-                exc_type, exc_value, exc_tb = exc_info_obj.exc_info()
-            """
-            If a real exception object is passed, extract:
-
-             -   Its type (type(error_details))
+            exc_type, exc_value, exc_tb = sys.exc_info()
 
-             -   The exception instance
+        if exc_tb is None:
+            # Fast path (no traceback to point at): use the construction site, skipping any
+            # subclass __init__ frames that chain up to this one
+            try:
+                frame = sys._getframe(1)
+            except AttributeError: # non-CPython interpreters
+                frame = inspect.currentframe().f_back
+            while frame.f_back is not None and frame.f_code.co_name == "__init__" and frame.f_locals.get("self") is self:
+                frame = frame.f_back
+            self.file_name = frame.f_code.co_filename
+            self.lineno = frame.f_lineno
+        else:
+            # walk up the stack to find the first non-ResearchAnalystException frame
+            last_tb = exc_tb
+            while last_tb.tb_next:
+                last_tb = last_tb.tb_next
 
-             -   Its traceback (__traceback__)
-            """
-            elif isinstance(error_details, Exception): # e.g., a raised exception
-                exc_type, exc_value, exc_tb = type(error_details), error_details, error_details.__traceback__
-            else:
-                exc_type, exc_value, exc_tb = sys.exc_info()
+            self.file_name = last_tb.tb_frame.f_code.co_filename
+            self.lineno = last_tb.tb_lineno
+        self.error_message = norm_msg
 
-        # walk up the stack to find the first non-ResearchAnalystException frame
-        last_tb = exc_tb
-        while last_tb and last_tb.tb_next:
-            last_tb = last_tb.tb_next
+        # Keep the raw exc_info; the traceback string is only built on first access
+        self._exc_type, self._exc_value, self._exc_tb = exc_type, exc_value, exc_tb
+        self._str_cache = None
 
-        self.file_name = last_tb.tb_frame.f_code.co_filename if last_tb else "<unknown file>"
-        self.lineno = last_tb.tb_lineno if last_tb else -1
-        self.error_message = norm_msg
+        # Only the compact message goes into args[0]; the traceback stays out of it
+        super().__init__(norm_msg) # Calls the base Exception constructor.
 
-        # Full traceback as string if available
-        if exc_type and exc_tb:
-            self.traceback_str = ''.join(traceback.format_exception(exc_type, exc_value, exc_tb)) # Converts traceback into a multiline string using format_exception.
+    @cached_property
+    def traceback_str(self):
+        # Full traceback as string if available (formatted lazily, memoized in __dict__)
+        if self._exc_type and self._exc_tb:
+            tb_str = ''.join(traceback.format_exception(self._exc_type, self._exc_value, self._exc_tb)) # Converts traceback into a multiline string using format_exception.
         else:
-            self.traceback_str = "<no traceback available>"
-        
-        super().__init__(self.__str__()) # Calls the base Exception constructor.
+            tb_str = "<no traceback available>"
+        # Release the frames (and their locals) once the string exists
+        self._exc_type = self._exc_value = self._exc_tb = None
+        return tb_str
 
-        # This ensures that printing the exception prints a nice readable message.
+    def __reduce__(self):
+        # Live tracebacks can't be pickled/deep-copied: ship the formatted string instead
+        state = dict(self.__dict__)
+        state["traceback_str"] = self.traceback_str
+        state["_exc_type"] = state["_exc_value"] = state["_exc_tb"] = None
+        return self.__class__, self.args, state
 
     def __str__(self):
-        # compact, logger-friendly message (no leading spaces)
-        base = f"Error in [{self.file_name}] at line [{self.lineno}] | Message: {self.error_message}"
-        if self.traceback_str:
-            return f"{base}\nTraceback:\n{self.traceback_str}"
-        return base
+        # Built once, then reused on every subsequent log call
+        if self._str_cache is None:
+            # compact, logger-friendly message (no leading spaces)
+            base = f"Error in [{self.file_name}] at line [{self.lineno}] | Message: {self.error_message}"
+            if self.traceback_str:
+                self._str_cache = f"{base}\nTraceback:\n{self.traceback_str}"
+            else:
+                self._str_cache = base
+        return self._str_cache
 
     def __repr__(self):
-        return f"ResearchAnalysisException(file={self.filename!r}, line={self.lineno}, message={self.error_message!r})"
+        return f"ResearchAnalysisException(file={self.file_name!r}, line={self.lineno}, message={self.error_message!r})"
 
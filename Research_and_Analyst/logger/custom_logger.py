@@ -1,47 +1,139 @@
 import os
+import atexit
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+import threading
+import time
+import warnings
+import orjson
 import structlog
 
-class CustomLogger:
-    def __init__(self, log_dir="logs"):
+_CONFIGURED = False
+_CONFIGURE_LOCK = threading.Lock()
+_LOGS_DIR = None # directory chosen by the first get_logger() call
+
+
+def _orjson_dumps(obj, default=None, **_):
+    # orjson returns bytes; stdlib handlers expect str
+    return orjson.dumps(obj, default=default).decode()
+
+
+class _RenderOnceFormatter(structlog.stdlib.ProcessorFormatter):
+    """
+    ProcessorFormatter that renders each record once, even when several handlers share it.
+    """
+
+    def format(self, record):
+        rendered = record.__dict__.get("_rendered_json")
+        if rendered is None:
+            rendered = super().format(record)
+            record._rendered_json = rendered
+        return rendered
+
+
+def _warn_if_other_dir(logs_dir):
+    if logs_dir != _LOGS_DIR:
+        warnings.warn(
+            f"Logging is already configured to write under {_LOGS_DIR!r}; ignoring log_dir {logs_dir!r}",
+            RuntimeWarning,
+            stacklevel=4,
+        )
+
+
+def _configure_once(log_dir):
+    """
+    Attach the console/queued-file handlers and configure structlog exactly once per process.
+    """
+    global _CONFIGURED, _LOGS_DIR
+    logs_dir = os.path.join(os.getcwd(), log_dir)
+    if _CONFIGURED:
+        _warn_if_other_dir(logs_dir)
+        return
+
+    with _CONFIGURE_LOCK:
+        if _CONFIGURED:
+            _warn_if_other_dir(logs_dir)
+            return
+
         # Ensure the log directory exists
-        self.logs_dir = os.path.join(os.getcwd(), log_dir)
-        os.makedirs(self.logs_dir, exist_ok=True)
+        os.makedirs(logs_dir, exist_ok=True)
+        _LOGS_DIR = logs_dir
 
-        # Timestamped log file (for persistance)
-        log_file = f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log"
-        self.log_file_path = os.path.join(self.logs_dir, log_file)
+        # Timestamped log file (for persistance); nanosecond suffix keeps same-second processes apart
+        now_ns = time.time_ns()
+        stamp = time.strftime("%Y-%m-%d_%H-%M-%S", time.localtime(now_ns // 1_000_000_000))
+        log_file_path = os.path.join(logs_dir, f"{stamp}_{now_ns % 1_000_000_000:09d}.log")
 
+        # Shared processors for structlog events and foreign (stdlib) records
+        shared_processors = [
+            structlog.processors.TimeStamper(fmt=None, utc=True, key="timestamp"), # epoch float, no strftime per event
+            structlog.processors.add_log_level,
+            structlog.processors.format_exc_info, # render exc_info into an "exception" string field
+        ]
 
-    def get_logger(self, name=__file__):
-        logger_name = os.path.basename(name)
+        # Both handlers share one orjson-backed JSON renderer; the record is rendered for the first and reused by the second
+        json_formatter = _RenderOnceFormatter(
+            processor=structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+            foreign_pre_chain=shared_processors,
+        )
 
         # configure logging for console + file (both JSON)
-        file_handler = logging.FileHandler(self.log_file_path)
+        file_handler = logging.FileHandler(log_file_path, encoding="utf-8", delay=True) # file created on first write
         file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(logging.JSONFormatter())
+        file_handler.setFormatter(logging.Formatter("%(message)s")) # records arrive pre-rendered
+
+        # File I/O is drained by a background listener; the queue handler renders JSON on the caller's thread
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(logging.INFO)
+        queue_handler.setFormatter(json_formatter)
+
+        listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
 
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+        console_handler.setFormatter(json_formatter)
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", # structlog will handle JSON formatting
-            handlers = [console_handler, file_handler]
-        )
+        # Handlers go on the root logger (as basicConfig did) so third-party stdlib records are captured too;
+        # structlog loggers propagate up to it, so every record is still emitted exactly once
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(console_handler)
+        root_logger.addHandler(queue_handler)
 
         # Config structlog for JSON structured logging
         structlog.configure(
             processors=[
-                structlog.processors.TimeStamper(fmt="iso", utc=True, key="timestamp"),
-                structlog.processors.add_log_level,
-                structlog.processors.EventRenamer(to="event"),
-                structlog.processors.JSONRenderer()
+                structlog.stdlib.filter_by_level, # drop disabled levels before any other work
+                *shared_processors,
+                structlog.stdlib.PositionalArgumentsFormatter(), # supports %-style deferred formatting
+                structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
             ],
             logger_factory=structlog.stdlib.LoggerFactory(),
+            wrapper_class=structlog.stdlib.BoundLogger,
             cache_logger_on_first_use=True,
         )
 
-        return structlog.get_logger(logger_name)
+        _CONFIGURED = True
+
+
+class CustomLogger:
+    def __init__(self, log_dir="logs"):
+        # Directory and log file are resolved once, on the first get_logger() call in the process
+        self.log_dir = log_dir
+
+
+    def get_logger(self, name=__file__):
+        """
+        Return a concrete bound structlog logger for `name`.
+
+        Call this once at module scope and reuse the result; do not call it per request.
+        """
+        logger_name = os.path.basename(name)
+
+        _configure_once(self.log_dir)
+        # bind() materializes the lazy proxy so call sites skip the factory on every log call
+        return structlog.get_logger(logger_name).bind()
@@ -1,38 +1,110 @@
 import os
-import sys
+import logging
 import json
 import asyncio
+import threading
+from functools import lru_cache
+from types import MappingProxyType
 from dotenv import load_dotenv
 from utils.config_loader import load_config
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 from langchain_openai import ChatOpenAI
 from langchain_groq import ChatGroq
-from logger import GLOBAL_LOGGER as log
+from logger import GLOBAL_LOGGER
 from exceptions.custom_exception import ResearchAnalystException
 
+# Pre-bound once per module; reused by every call below
+log = GLOBAL_LOGGER.bind(component="model_loader")
 
-class ApiKeyManager:
+
+_API_KEY_NAMES = ("OPENAI_API_KEY", "GOOGLE_API_KEY", "GROQ_API_KEY")
+
+
+@lru_cache(maxsize=1)
+def _load_keys():
     """
-    Loads and manages all environment-based API keys.
+    Load the .env file and snapshot the API keys once per process.
+
+    Returns:
+        MappingProxyType: Read-only mapping of key name to value (or None).
     """
+    load_dotenv()
 
-    def __init__(self):
-        load_dotenv()
+    api_keys = MappingProxyType({k: os.environ.get(k) for k in _API_KEY_NAMES})
+
+    log.info("Initializing API Key Manager")
+
+    #Log loaded key statuses without exposing secrets
+    info_enabled = log.isEnabledFor(logging.INFO)
+    for key, val in api_keys.items():
+        if not val:
+            log.warning("No API Key found for %s", key)
+        elif info_enabled:
+            log.info("Loaded API Key for %s", key)
+
+    return api_keys
+
+
+@lru_cache(maxsize=1)
+def _cached_config():
+    """
+    Parse the YAML configuration once and share the result across ModelLoader instances.
+    """
+    config = load_config()
+    log.info("YAML configuration loaded successfully", config_keys=list(config.keys()))
+    return config
+
+
+def _ensure_event_loop():
+    """
+    Install an event loop for the current thread if it has none (running or set).
+    """
+    try:
+        asyncio.get_running_loop()
+        return
+    except RuntimeError:
+        pass
+
+    try:
+        asyncio.get_event_loop() # a loop already set (but not running) for this thread is kept
+    except RuntimeError:
+        asyncio.set_event_loop(asyncio.new_event_loop())
+
+
+# Provider name -> chat model constructor; each takes (model_name, temperature, max_tokens, api_key_manager)
+_LLM_FACTORIES = {
+    "openai": lambda model_name, temperature, max_tokens, keys: ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        api_key=keys.get("OPENAI_API_KEY"),
+    ),
+    "google": lambda model_name, temperature, max_tokens, keys: ChatGoogleGenerativeAI(
+        model=model_name,
+        temperature=temperature,
+        api_key=keys.get("GOOGLE_API_KEY"),
+        max_output_tokens=max_tokens,
+    ),
+    "groq": lambda model_name, temperature, max_tokens, keys: ChatGroq(
+        model=model_name,
+        temperature=temperature,
+        api_key=keys.get("GROQ_API_KEY"),
+    ),
+}
+
+
+# Built clients, shared across ModelLoader instances; misses are filled under the lock
+_EMBEDDINGS_CACHE = {}
+_LLM_CACHE = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
 
-        self.api_keys = {
-            "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY"),
-            "GOOGLE_API_KEY": os.getenv("GOOGLE_API_KEY"),
-            "GROQ_API_KEY": os.getenv("GROQ_API_KEY"),
-        }
 
-        log.info("Initializing API Key Manager")
+class ApiKeyManager:
+    """
+    Loads and manages all environment-based API keys.
+    """
 
-        #Log loaded key statuses without exposing secrets
-        for key, val in self.api_keys.items():
-            if val:
-                log.info(f"Loaded API Key for {key}")
-            else:
-                log.warning(f"No API Key found for {key}")
+    def __init__(self):
+        self.api_keys = _load_keys()
 
     
     def get(self, key: str):
@@ -61,11 +133,12 @@ class ModelLoader:
 
         try:
             self.api_key_manager = ApiKeyManager()
-            self.config = load_config()
-            log.info("YAML configuration loaded successfully", config_keys=list(self.config.keys()))
+            self.config = _cached_config()
+        except ResearchAnalystException:
+            raise
         except Exception as e:
             log.error("Error initializing ModelLoader", error=str(e))
-            raise ResearchAnalystException(f"Failed to initialize ModelLoader", sys)
+            raise ResearchAnalystException("Failed to initialize ModelLoader", e)
 
         
     # ------------------------------------------------------------ #
@@ -78,27 +151,40 @@ class ModelLoader:
         Returns:
             GoogleGenerativeAIEmbeddings: The loaded embedding model.
         """
+        model_name = None # bound up front so the except handler can always reference it
         try:
             model_name = self.config["embedding_model"]["model_name"]
-            log.info(f"Loading embedding model: {model_name}")
 
-            # Ensure event loop exists for grpc-based embedding API
-            try:
-                asyncio.get_running_loop()
-            except RuntimeError:
-                asyncio.set_event_loop(asyncio.new_event_loop())
+            embeddings = _EMBEDDINGS_CACHE.get(model_name)
+            if embeddings is not None:
+                return embeddings
+
+            with _CLIENT_CACHE_LOCK:
+                # Another thread may have built it while we waited
+                embeddings = _EMBEDDINGS_CACHE.get(model_name)
+                if embeddings is not None:
+                    return embeddings
+
+                log.info("Loading embedding model: %s", model_name)
 
-            embeddings = GoogleGenerativeAIEmbeddings(
-                model=model_name,
-                api_key=self.api_key_manager.get("GOOGLE_API_KEY"),
-            )
+                # The grpc async client inside the embeddings needs a loop only while it is being
+                # constructed; later embed calls from other threads don't, so cache hits skip this
+                _ensure_event_loop()
+
+                embeddings = GoogleGenerativeAIEmbeddings(
+                    model=model_name,
+                    api_key=self.api_key_manager.get("GOOGLE_API_KEY"),
+                )
 
-            log.info(f"Embedding model {model_name} loaded successfully")
-            return embeddings
+                _EMBEDDINGS_CACHE[model_name] = embeddings
+                log.info("Embedding model %s loaded successfully", model_name)
+                return embeddings
 
+        except ResearchAnalystException:
+            raise
         except Exception as e:
-            log.error(f"Error loading embedding model {model_name}", error=str(e))
-            raise ResearchAnalystException(f"Failed to load embedding model {model_name}", sys)
+            log.error("Error loading embedding model %s", model_name, error=str(e))
+            raise ResearchAnalystException(f"Failed to load embedding model {model_name}", e)
 
     
     # ------------------------------------------------------------ #
@@ -117,13 +203,14 @@ class ModelLoader:
             ChatOpenAI | ChatGoogleGenerativeAI | ChatGroq: The loaded LLM model.
         """
 
+        model_name = None # bound up front so the except handler can always reference it
         try:
             llm_block = self.config["llm"]
             provider_key = os.getenv("LLM_PROVIDER", "openai").upper()
 
             if provider_key not in llm_block:
                 log.error("LLM provider not found in configuration", provider = provider_key)
-                raise ResearchAnalystException(f"LLM provider {provider_key} not found in configuration", sys)
+                raise ResearchAnalystException(f"LLM provider {provider_key} not found in configuration")
 
             llm_config = llm_block[provider_key]
             provider = llm_config.get("provider")
@@ -131,40 +218,35 @@ class ModelLoader:
             temperature = llm_config.get("temperature", 0.7)
             max_tokens = llm_config.get("max_tokens", 1000)
 
-            log.info(f"Loading LLM: {provider} {model_name} with temperature {temperature} and max_tokens {max_tokens}")
+            cache_key = (provider, model_name, temperature, max_tokens)
+            llm = _LLM_CACHE.get(cache_key)
+            if llm is not None:
+                return llm
 
-            if provider == "openai":
-                llm = ChatOpenAI(
-                    model=model_name,
-                    temperature=temperature,
-                    api_key=self.api_key_manager.get("OPENAI_API_KEY"),
-                )
-            
-            elif provider == "google":
-                llm = ChatGoogleGenerativeAI(
-                    model=model_name,
-                    temperature=temperature,
-                    api_key=self.api_key_manager.get("GOOGLE_API_KEY"),
-                    max_output_tokens=max_tokens,
-                )
+            with _CLIENT_CACHE_LOCK:
+                # Another thread may have built it while we waited
+                llm = _LLM_CACHE.get(cache_key)
+                if llm is not None:
+                    return llm
 
-            elif provider == "groq":
-                llm = ChatGroq(
-                    model=model_name,
-                    temperature=temperature,
-                    api_key=self.api_key_manager.get("GROQ_API_KEY"),
-                )
+                log.info("Loading LLM: %s %s with temperature %s and max_tokens %s", provider, model_name, temperature, max_tokens)
+
+                factory = _LLM_FACTORIES.get(provider)
+                if factory is None:
+                    log.error("Unsupported LLM provider", provider = provider)
+                    raise ValueError(f"Unsupported LLM provider {provider}")
 
-            else:
-                log.error("Unsupported LLM provider", provider = provider)
-                raise ValueError(f"Unsupported LLM provider {provider}")
+                llm = factory(model_name, temperature, max_tokens, self.api_key_manager)
 
-            log.info(f"LLM {model_name} loaded successfully")
-            return llm
+                _LLM_CACHE[cache_key] = llm
+                log.info("LLM %s loaded successfully", model_name)
+                return llm
 
+        except ResearchAnalystException:
+            raise # already wrapped (e.g. provider missing from config)
         except Exception as e:
-            log.error(f"Error loading LLM {model_name}", error=str(e))
-            raise ResearchAnalystException(f"Failed to load LLM {model_name}", sys)
+            log.error("Error loading LLM %s", model_name, error=str(e))
+            raise ResearchAnalystException(f"Failed to load LLM {model_name}", e)
 
         
 
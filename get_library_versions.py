@@ -1,7 +1,7 @@
 import importlib.metadata
+import re
 
 pacakges = [
-    "langchain-community",
     "langchain-community",
     "langchain-core",
     "langchain-google-genai",
@@ -10,9 +10,23 @@ pacakges = [
     "langgraph",
 ]
 
-for pkg in pacakges:
-    try:
-        version = importlib.metadata.version(pkg)
+
+def _normalize(name):
+    # PEP 503 name normalization
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+# Scan installed distributions once, then look each package up by name.
+# Keep the first match on sys.path, as importlib.metadata.version() does.
+installed = {}
+for dist in importlib.metadata.distributions():
+    name = dist.metadata["Name"]
+    if name:
+        installed.setdefault(_normalize(name), dist.version)
+
+for pkg in dict.fromkeys(pacakges):
+    version = installed.get(_normalize(pkg))
+    if version is not None:
         print(f"{pkg}=={version}")
-    except importlib.metadata.PackageNotFoundError:
+    else:
         print(f"{pkg} not found")
\ No newline at end of file